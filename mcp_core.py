@@ -0,0 +1,833 @@
+"""MCP protocol models and tool implementations served by main.py
+
+Kept apart from the web app so it can optionally be compiled with Cython
+(``cythonize -i mcp_core.py``). Python imports the compiled extension in
+preference to this file when both are present.
+"""
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, ValidationError
+from pydantic_core import to_json
+from typing import Dict, Any, List, Callable, Awaitable, Optional
+from functools import lru_cache
+import asyncio
+import logging
+import os
+import sys
+import hashlib
+import random
+import datetime
+import time
+import re
+import http.cookiejar
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# URL pattern used by the validate_url tool, compiled once at import
+URL_PATTERN = re.compile(
+    r'^https?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
+    r'localhost|'  # localhost...
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+
+# MCP Protocol Models
+class MCPRequest(BaseModel):
+    jsonrpc: str = "2.0"
+    id: str
+    method: str
+    params: Dict[str, Any] = {}
+
+class MCPResponse(BaseModel):
+    jsonrpc: str = "2.0"
+    id: str
+    result: Dict[str, Any] = {}
+    error: Dict[str, Any] = None
+
+class MCPNotification(BaseModel):
+    jsonrpc: str = "2.0"
+    method: str
+    params: Dict[str, Any] = {}
+
+def is_parse_error(exc: Exception) -> bool:
+    """Check whether model_validate_json failed on malformed JSON rather than on the schema"""
+    return isinstance(exc, ValidationError) and exc.errors()[0]["type"] == "json_invalid"
+
+def read_text_file(filepath: str) -> str:
+    with open(filepath, 'r', encoding='utf-8') as file:
+        return file.read()
+
+def write_text_file(filepath: str, content: str) -> None:
+    with open(filepath, 'w', encoding='utf-8') as file:
+        file.write(content)
+
+# Last formatted timestamp as [millisecond, isoformat string]
+time_cache: List[Any] = [0, ""]
+
+def current_time_iso() -> str:
+    """Current local time in ISO format, reformatted at most once per millisecond"""
+    now_ns = time.time_ns()
+    bucket = now_ns // 1_000_000
+    if bucket != time_cache[0]:
+        time_cache[0] = bucket
+        time_cache[1] = datetime.datetime.fromtimestamp(now_ns / 1e9).isoformat()
+    return time_cache[1]
+
+# Limits for tools/call_batch: items per batch, and async tool calls in flight at once
+MAX_BATCH_SIZE = 100
+BATCH_CONCURRENCY = 10
+
+class InvalidParamsError(ValueError):
+    """Raised when tool call parameters are malformed (JSON-RPC -32602)"""
+
+# random.randint() re-checks its arguments through randrange() on every call;
+# draw from the shared generator's _randbelow directly, as randint does underneath
+randbelow = random._inst._randbelow
+
+def uuid4_str() -> str:
+    """Random UUID4 string, equivalent to str(uuid.uuid4()) without building a UUID object"""
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40  # version 4
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+# MD5 is only offered as a checksum, so opt out of FIPS security gating where supported
+MD5_OPTIONS = {"usedforsecurity": False} if sys.version_info >= (3, 9) else {}
+
+def md5_hex(text: str) -> str:
+    return hashlib.md5(text.encode(), **MD5_OPTIONS).hexdigest()
+
+def sha256_hex(text: str) -> str:
+    # hashlib is backed by OpenSSL, which uses SHA-NI instructions when the CPU has them
+    return hashlib.sha256(text.encode()).hexdigest()
+
+# Short inputs (tool names, prompts) tend to be hashed repeatedly, so recent digests
+# are memoized. Longer inputs skip the cache: hashing the cache key costs about as
+# much as the digest itself. With 256-character keys and 1024 entries each cache
+# holds at most ~1.3 MiB (non-BMP text), ~0.5 MiB for ASCII.
+HASH_CACHE_TEXT_LIMIT = 256
+cached_md5_hex = lru_cache(maxsize=1024)(md5_hex)
+cached_sha256_hex = lru_cache(maxsize=1024)(sha256_hex)
+
+# MCP Server Implementation
+class MCPServer:
+    def __init__(self):
+        self.tools = {
+            # Basic tools
+            "echo": {
+                "name": "echo",
+                "description": "Echo back the input text",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "text": {
+                            "type": "string",
+                            "description": "Text to echo back"
+                        }
+                    },
+                    "required": ["text"]
+                }
+            },
+            "get_time": {
+                "name": "get_time",
+                "description": "Get current server time",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {}
+                }
+            },
+            
+            # Mathematical operations
+            "add": {
+                "name": "add",
+                "description": "Add two numbers together",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "a": {
+                            "type": "number",
+                            "description": "First number"
+                        },
+                        "b": {
+                            "type": "number",
+                            "description": "Second number"
+                        }
+                    },
+                    "required": ["a", "b"]
+                }
+            },
+            "subtract": {
+                "name": "subtract",
+                "description": "Subtract second number from first number",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "a": {
+                            "type": "number",
+                            "description": "First number"
+                        },
+                        "b": {
+                            "type": "number",
+                            "description": "Second number"
+                        }
+                    },
+                    "required": ["a", "b"]
+                }
+            },
+            "multiply": {
+                "name": "multiply",
+                "description": "Multiply two numbers",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "a": {
+                            "type": "number",
+                            "description": "First number"
+                        },
+                        "b": {
+                            "type": "number",
+                            "description": "Second number"
+                        }
+                    },
+                    "required": ["a", "b"]
+                }
+            },
+            "divide": {
+                "name": "divide",
+                "description": "Divide first number by second number",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "a": {
+                            "type": "number",
+                            "description": "First number"
+                        },
+                        "b": {
+                            "type": "number",
+                            "description": "Second number"
+                        }
+                    },
+                    "required": ["a", "b"]
+                }
+            },
+            "power": {
+                "name": "power",
+                "description": "Raise first number to the power of second number",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "base": {
+                            "type": "number",
+                            "description": "Base number"
+                        },
+                        "exponent": {
+                            "type": "number",
+                            "description": "Exponent"
+                        }
+                    },
+                    "required": ["base", "exponent"]
+                }
+            },
+            "sqrt": {
+                "name": "sqrt",
+                "description": "Calculate square root of a number",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "number": {
+                            "type": "number",
+                            "description": "Number to calculate square root of"
+                        }
+                    },
+                    "required": ["number"]
+                }
+            },
+            
+            # String operations
+            "uppercase": {
+                "name": "uppercase",
+                "description": "Convert text to uppercase",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "text": {
+                            "type": "string",
+                            "description": "Text to convert to uppercase"
+                        }
+                    },
+                    "required": ["text"]
+                }
+            },
+            "lowercase": {
+                "name": "lowercase",
+                "description": "Convert text to lowercase",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "text": {
+                            "type": "string",
+                            "description": "Text to convert to lowercase"
+                        }
+                    },
+                    "required": ["text"]
+                }
+            },
+            "reverse_string": {
+                "name": "reverse_string",
+                "description": "Reverse a string",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "text": {
+                            "type": "string",
+                            "description": "Text to reverse"
+                        }
+                    },
+                    "required": ["text"]
+                }
+            },
+            "string_length": {
+                "name": "string_length",
+                "description": "Get the length of a string",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "text": {
+                            "type": "string",
+                            "description": "Text to measure"
+                        }
+                    },
+                    "required": ["text"]
+                }
+            },
+            
+            # File operations
+            "read_file": {
+                "name": "read_file",
+                "description": "Read contents of a file",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "filepath": {
+                            "type": "string",
+                            "description": "Path to the file to read"
+                        }
+                    },
+                    "required": ["filepath"]
+                }
+            },
+            "write_file": {
+                "name": "write_file",
+                "description": "Write content to a file",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "filepath": {
+                            "type": "string",
+                            "description": "Path to the file to write"
+                        },
+                        "content": {
+                            "type": "string",
+                            "description": "Content to write to the file"
+                        }
+                    },
+                    "required": ["filepath", "content"]
+                }
+            },
+            "list_directory": {
+                "name": "list_directory",
+                "description": "List files and directories in a path",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "path": {
+                            "type": "string",
+                            "description": "Directory path to list"
+                        }
+                    },
+                    "required": ["path"]
+                }
+            },
+            
+            # Utility functions
+            "random_number": {
+                "name": "random_number",
+                "description": "Generate a random number between min and max",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "min": {
+                            "type": "number",
+                            "description": "Minimum value"
+                        },
+                        "max": {
+                            "type": "number",
+                            "description": "Maximum value"
+                        }
+                    },
+                    "required": ["min", "max"]
+                }
+            },
+            "generate_uuid": {
+                "name": "generate_uuid",
+                "description": "Generate a random UUID",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {}
+                }
+            },
+            "hash_md5": {
+                "name": "hash_md5",
+                "description": "Generate MD5 hash of input text",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "text": {
+                            "type": "string",
+                            "description": "Text to hash"
+                        }
+                    },
+                    "required": ["text"]
+                }
+            },
+            "hash_sha256": {
+                "name": "hash_sha256",
+                "description": "Generate SHA256 hash of input text",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "text": {
+                            "type": "string",
+                            "description": "Text to hash"
+                        }
+                    },
+                    "required": ["text"]
+                }
+            },
+            
+            # Web utilities
+            "validate_url": {
+                "name": "validate_url",
+                "description": "Validate if a string is a valid URL",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "url": {
+                            "type": "string",
+                            "description": "URL to validate"
+                        }
+                    },
+                    "required": ["url"]
+                }
+            },
+            "make_request": {
+                "name": "make_request",
+                "description": "Make an HTTP request to a URL",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "url": {
+                            "type": "string",
+                            "description": "URL to request"
+                        },
+                        "method": {
+                            "type": "string",
+                            "description": "HTTP method (GET, POST, etc.)",
+                            "default": "GET"
+                        },
+                        "headers": {
+                            "type": "object",
+                            "description": "HTTP headers",
+                            "default": {}
+                        }
+                    },
+                    "required": ["url"]
+                }
+            }
+        }
+        
+        # Tool name -> implementation, looked up once per call
+        self.sync_handlers: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            "echo": self._echo,
+            "get_time": self._get_time,
+            "add": self._add,
+            "subtract": self._subtract,
+            "multiply": self._multiply,
+            "divide": self._divide,
+            "power": self._power,
+            "sqrt": self._sqrt,
+            "uppercase": self._uppercase,
+            "lowercase": self._lowercase,
+            "reverse_string": self._reverse_string,
+            "string_length": self._string_length,
+            "random_number": self._random_number,
+            "generate_uuid": self._generate_uuid,
+            "hash_md5": self._hash_md5,
+            "hash_sha256": self._hash_sha256,
+            "validate_url": self._validate_url
+        }
+        self.async_handlers: Dict[str, Callable[[Dict[str, Any]], Awaitable[Any]]] = {
+            "read_file": self._read_file,
+            "write_file": self._write_file,
+            "list_directory": self._list_directory,
+            "make_request": self._make_request
+        }
+        
+        # JSON-RPC method -> handler; json_method_handlers return pre-serialized
+        # responses and take precedence in handle_request_json
+        self.method_handlers: Dict[str, Callable[[MCPRequest], Awaitable[MCPResponse]]] = {
+            "initialize": self._on_initialize,
+            "tools/list": self._on_tools_list,
+            "tools/call": self._on_tools_call,
+            "tools/call_batch": self._on_tools_call_batch
+        }
+        self.json_method_handlers: Dict[str, Callable[[MCPRequest], bytes]] = {
+            "tools/list": self._on_tools_list_json
+        }
+        
+        # Pooled client reused by make_request so connections are kept alive
+        self.http_client: Optional[httpx.AsyncClient] = None
+        
+        # The tool catalog never changes after startup, so serialize it once
+        # and keep the names separately for membership checks
+        self.tool_names = frozenset(self.tools)
+        self.tools_list = list(self.tools.values())
+        self.tools_list_json = to_json({"tools": self.tools_list})
+    
+    def get_http_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use
+
+        The client is shared by every caller, so its cookie jar refuses all
+        cookies; otherwise a Set-Cookie from one make_request would be sent on
+        later requests made on behalf of other clients.
+        """
+        if self.http_client is None:
+            self.http_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+                cookies=http.cookiejar.CookieJar(
+                    policy=http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+                )
+            )
+        return self.http_client
+    
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        if self.http_client is not None:
+            await self.http_client.aclose()
+            self.http_client = None
+    
+    async def handle_request_json(self, request: MCPRequest) -> bytes:
+        """Handle MCP requests and return the serialized JSON-RPC response"""
+        handler = self.json_method_handlers.get(request.method)
+        if handler is not None:
+            return handler(request)
+        
+        response = await self.handle_request(request)
+        return to_json(response)
+    
+    async def handle_request(self, request: MCPRequest) -> MCPResponse:
+        """Handle MCP requests"""
+        try:
+            handler = self.method_handlers.get(request.method)
+            if handler is None:
+                return MCPResponse(
+                    id=request.id,
+                    error={
+                        "code": -32601,
+                        "message": f"Method '{request.method}' not found"
+                    }
+                )
+            
+            return await handler(request)
+        
+        except Exception as e:
+            logger.error(f"Error handling request: {e}")
+            return MCPResponse(
+                id=request.id,
+                error={
+                    "code": -32603,
+                    "message": f"Internal error: {str(e)}"
+                }
+            )
+    
+    async def _on_initialize(self, request: MCPRequest) -> MCPResponse:
+        return MCPResponse(
+            id=request.id,
+            result={
+                "protocolVersion": "2024-11-05",
+                "capabilities": {
+                    "tools": {}
+                },
+                "serverInfo": {
+                    "name": "fastapi-mcp-server",
+                    "version": "1.0.0"
+                }
+            }
+        )
+    
+    async def _on_tools_list(self, request: MCPRequest) -> MCPResponse:
+        return MCPResponse(
+            id=request.id,
+            result={
+                "tools": self.tools_list
+            }
+        )
+    
+    def _on_tools_list_json(self, request: MCPRequest) -> bytes:
+        # Splice the pre-serialized catalog into the envelope instead of re-encoding it
+        return b'{"jsonrpc":"2.0","id":%s,"result":%s,"error":null}' % (
+            to_json(request.id),
+            self.tools_list_json
+        )
+    
+    async def _on_tools_call(self, request: MCPRequest) -> MCPResponse:
+        tool_name = request.params.get("name")
+        arguments = request.params.get("arguments", {})
+        
+        if tool_name not in self.tool_names:
+            return self._tool_not_found(request, tool_name)
+        
+        result = await self.call_tool(tool_name, arguments)
+        return MCPResponse(
+            id=request.id,
+            result={
+                "content": [
+                    {
+                        "type": "text",
+                        "text": str(result)
+                    }
+                ]
+            }
+        )
+    
+    async def _on_tools_call_batch(self, request: MCPRequest) -> MCPResponse:
+        tool_name = request.params.get("name")
+        arguments_list = request.params.get("arguments_list", [])
+        
+        if tool_name not in self.tool_names:
+            return self._tool_not_found(request, tool_name)
+        
+        try:
+            results = await self.call_tool_batch(tool_name, arguments_list)
+        except InvalidParamsError as e:
+            return MCPResponse(
+                id=request.id,
+                error={
+                    "code": -32602,
+                    "message": f"Invalid params: {str(e)}"
+                }
+            )
+        
+        return MCPResponse(
+            id=request.id,
+            result={
+                "content": [
+                    {
+                        "type": "text",
+                        "text": str(result["result"])
+                    }
+                    if "result" in result else
+                    {
+                        "type": "text",
+                        "text": result["error"],
+                        "isError": True
+                    }
+                    for result in results
+                ]
+            }
+        )
+    
+    def _tool_not_found(self, request: MCPRequest, tool_name: Any) -> MCPResponse:
+        return MCPResponse(
+            id=request.id,
+            error={
+                "code": -32601,
+                "message": f"Tool '{tool_name}' not found"
+            }
+        )
+    
+    async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
+        """Call a specific tool with given arguments"""
+        handler = self.sync_handlers.get(tool_name)
+        if handler is not None:
+            return handler(arguments)
+        
+        handler = self.async_handlers.get(tool_name)
+        if handler is not None:
+            return await handler(arguments)
+        
+        raise ValueError(f"Unknown tool: {tool_name}")
+    
+    async def call_tool_batch(self, tool_name: str, arguments_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Call a tool once per set of arguments, returning results in the same order
+
+        Every item runs even if another fails; each entry is either
+        {"result": ...} or {"error": ...}.
+        """
+        if not isinstance(arguments_list, list) or not all(isinstance(arguments, dict) for arguments in arguments_list):
+            raise InvalidParamsError("arguments_list must be a list of objects")
+        if len(arguments_list) > MAX_BATCH_SIZE:
+            raise InvalidParamsError(f"arguments_list cannot contain more than {MAX_BATCH_SIZE} items")
+        
+        handler = self.sync_handlers.get(tool_name)
+        if handler is not None:
+            results = []
+            for arguments in arguments_list:
+                try:
+                    results.append({"result": handler(arguments)})
+                except Exception as e:
+                    results.append({"error": str(e)})
+            return results
+        
+        async_handler = self.async_handlers.get(tool_name)
+        if async_handler is not None:
+            semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+            
+            async def run(arguments: Dict[str, Any]) -> Dict[str, Any]:
+                async with semaphore:
+                    try:
+                        return {"result": await async_handler(arguments)}
+                    except Exception as e:
+                        return {"error": str(e)}
+            
+            return list(await asyncio.gather(*(run(arguments) for arguments in arguments_list)))
+        
+        raise ValueError(f"Unknown tool: {tool_name}")
+    
+    # Basic tools
+    def _echo(self, arguments: Dict[str, Any]) -> Any:
+        return arguments.get("text", "")
+    
+    def _get_time(self, arguments: Dict[str, Any]) -> Any:
+        return current_time_iso()
+    
+    # Mathematical operations
+    def _add(self, arguments: Dict[str, Any]) -> Any:
+        a = arguments.get("a", 0)
+        b = arguments.get("b", 0)
+        return a + b
+    
+    def _subtract(self, arguments: Dict[str, Any]) -> Any:
+        a = arguments.get("a", 0)
+        b = arguments.get("b", 0)
+        return a - b
+    
+    def _multiply(self, arguments: Dict[str, Any]) -> Any:
+        a = arguments.get("a", 0)
+        b = arguments.get("b", 0)
+        return a * b
+    
+    def _divide(self, arguments: Dict[str, Any]) -> Any:
+        a = arguments.get("a", 0)
+        b = arguments.get("b", 0)
+        if b == 0:
+            raise ValueError("Division by zero is not allowed")
+        return a / b
+    
+    def _power(self, arguments: Dict[str, Any]) -> Any:
+        base = arguments.get("base", 0)
+        exponent = arguments.get("exponent", 0)
+        return base ** exponent
+    
+    def _sqrt(self, arguments: Dict[str, Any]) -> Any:
+        number = arguments.get("number", 0)
+        if number < 0:
+            raise ValueError("Cannot calculate square root of negative number")
+        return number ** 0.5
+    
+    # String operations
+    def _uppercase(self, arguments: Dict[str, Any]) -> Any:
+        text = arguments.get("text", "")
+        return text.upper()
+    
+    def _lowercase(self, arguments: Dict[str, Any]) -> Any:
+        text = arguments.get("text", "")
+        return text.lower()
+    
+    def _reverse_string(self, arguments: Dict[str, Any]) -> Any:
+        text = arguments.get("text", "")
+        return text[::-1]
+    
+    def _string_length(self, arguments: Dict[str, Any]) -> Any:
+        text = arguments.get("text", "")
+        return len(text)
+    
+    # File operations run in the threadpool so disk I/O doesn't block the event loop
+    async def _read_file(self, arguments: Dict[str, Any]) -> Any:
+        filepath = arguments.get("filepath", "")
+        try:
+            return await run_in_threadpool(read_text_file, filepath)
+        except FileNotFoundError:
+            raise ValueError(f"File not found: {filepath}")
+        except Exception as e:
+            raise ValueError(f"Error reading file: {str(e)}")
+    
+    async def _write_file(self, arguments: Dict[str, Any]) -> Any:
+        filepath = arguments.get("filepath", "")
+        content = arguments.get("content", "")
+        try:
+            await run_in_threadpool(write_text_file, filepath, content)
+            return f"Successfully wrote {len(content)} characters to {filepath}"
+        except Exception as e:
+            raise ValueError(f"Error writing file: {str(e)}")
+    
+    async def _list_directory(self, arguments: Dict[str, Any]) -> Any:
+        path = arguments.get("path", ".")
+        try:
+            items = await run_in_threadpool(os.listdir, path)
+            return {
+                "path": path,
+                "items": items,
+                "count": len(items)
+            }
+        except FileNotFoundError:
+            raise ValueError(f"Directory not found: {path}")
+        except Exception as e:
+            raise ValueError(f"Error listing directory: {str(e)}")
+    
+    # Utility functions
+    def _random_number(self, arguments: Dict[str, Any]) -> Any:
+        min_val = arguments.get("min", 0)
+        max_val = arguments.get("max", 100)
+        if min_val > max_val:
+            raise ValueError("Minimum value cannot be greater than maximum value")
+        low = int(min_val)
+        return low + randbelow(int(max_val) - low + 1)
+    
+    def _generate_uuid(self, arguments: Dict[str, Any]) -> Any:
+        return uuid4_str()
+    
+    def _hash_md5(self, arguments: Dict[str, Any]) -> Any:
+        text = arguments.get("text", "")
+        if len(text) <= HASH_CACHE_TEXT_LIMIT:
+            return cached_md5_hex(text)
+        return md5_hex(text)
+    
+    def _hash_sha256(self, arguments: Dict[str, Any]) -> Any:
+        text = arguments.get("text", "")
+        if len(text) <= HASH_CACHE_TEXT_LIMIT:
+            return cached_sha256_hex(text)
+        return sha256_hex(text)
+    
+    # Web utilities
+    def _validate_url(self, arguments: Dict[str, Any]) -> Any:
+        url = arguments.get("url", "")
+        return URL_PATTERN.match(url) is not None
+    
+    async def _make_request(self, arguments: Dict[str, Any]) -> Any:
+        url = arguments.get("url", "")
+        method = arguments.get("method", "GET").upper()
+        headers = arguments.get("headers", {})
+        
+        try:
+            response = await self.get_http_client().request(method, url, headers=headers)
+            return {
+                "status_code": response.status_code,
+                "headers": dict(response.headers),
+                "content": response.text,
+                "url": str(response.url)
+            }
+        except Exception as e:
+            raise ValueError(f"Error making request: {str(e)}")